@@ -4,56 +4,169 @@ Configuration handling for Datasette MCP Server.
 Handles loading, validation, and building of configuration from files and CLI arguments.
 """
 
+import asyncio
+import copy
 import json
 import logging
 import os
+import re
+import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
-import yaml
+try:
+    # Same optional speedup as response parsing in main; orjson's
+    # JSONDecodeError subclasses json.JSONDecodeError, so error handling
+    # below works for either parser
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Lazily imported PyYAML module and loader class; JSON-only deployments
+# never pay the PyYAML import cost
+_yaml: Optional[tuple] = None
+
+
+def _get_yaml() -> tuple:
+    """Import PyYAML on first use and pick the fastest available loader."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+        try:
+            # libyaml-backed C parser, roughly an order of magnitude faster
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _yaml = (yaml, loader)
+    return _yaml
+
+# Parsed-config cache keyed by path; entries are (mtime_ns, size, parsed dict)
+_config_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Short-lived cache of the resolved config path, so repeated lookups skip
+# the directory probes entirely
+_FIND_CACHE_TTL = 5.0  # seconds
+_find_cache: Optional[Tuple[float, Optional[Path]]] = None
+
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Recognized per-instance config fields
+_KNOWN_FIELDS = frozenset({'url', 'auth_token', 'description'})
+
+# Accepted URL schemes for instance URLs
+_ALLOWED_SCHEMES = ('http', 'https')
+
+# Runs of characters that get collapsed to underscores in derived instance IDs
+_NON_ALNUM_RUN_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+
+@dataclass(frozen=True, slots=True)
+class InstanceInfo:
+    """Immutable per-instance connection details, precomputed at startup."""
+
+    url: str
+    headers: Mapping[str, str]
+    description: str
+    name: str
+
+
+# Per-instance records built during validate_config, keyed by instance name
+_instances: Dict[str, InstanceInfo] = {}
+
+
+# Config filename candidates, in priority order
+_CONFIG_FILENAMES = ('config.yaml', 'config.yml', 'config.json')
+
+# Config directories in priority order, resolved once at import
+_USER_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.config', 'datasette-mcp')
+_SYSTEM_CONFIG_DIR = '/etc/datasette-mcp'
+_CONFIG_DIRS = (_USER_CONFIG_DIR, _SYSTEM_CONFIG_DIR)
+
+
+def _first_existing(dirpath: str, names: tuple) -> Optional[Path]:
+    """Return the first of names present in dirpath, using one directory scan.
+
+    A single scandir replaces one stat syscall per candidate filename, and
+    short-circuits entirely when the directory doesn't exist.
+    """
+    try:
+        entries = {e.name: e for e in os.scandir(dirpath)}
+    except OSError:
+        return None
+    for name in names:
+        entry = entries.get(name)
+        if entry is not None and entry.is_file():
+            return Path(dirpath) / name
+    return None
+
+
+def _redacted_view(config: Any) -> Any:
+    """Copy of the config with auth tokens masked, for safe debug logging."""
+    if not isinstance(config, dict) or not isinstance(config.get('datasette_instances'), dict):
+        return config
+    redacted = dict(config)
+    redacted['datasette_instances'] = {
+        name: {**instance, 'auth_token': '***'}
+        if isinstance(instance, dict) and 'auth_token' in instance else instance
+        for name, instance in config['datasette_instances'].items()
+    }
+    return redacted
+
+
+def invalidate_config_cache() -> None:
+    """Drop cached config path lookups and parsed configs (mainly for tests)."""
+    global _find_cache
+    _find_cache = None
+    _config_cache.clear()
+
 
 def find_config_file() -> Optional[Path]:
-    """Find datasette-mcp config file in standard locations."""
-    
-    # 1. Environment variable
+    """Find datasette-mcp config file in standard locations.
+
+    The resolved path is cached briefly so back-to-back lookups don't
+    re-probe the filesystem.
+    """
+    global _find_cache
+
+    if _find_cache is not None and _find_cache[0] > time.monotonic():
+        return _find_cache[1]
+
+    found = _find_config_file_uncached()
+    _find_cache = (time.monotonic() + _FIND_CACHE_TTL, found)
+    return found
+
+
+def _find_config_file_uncached() -> Optional[Path]:
+    """Probe the standard config locations."""
+
+    # 1. Environment variable (string ops only; the winner becomes a Path)
     env_config = os.getenv('DATASETTE_MCP_CONFIG')
     if env_config:
-        env_path = Path(env_config)
-        
-        if env_path.is_absolute():
+        if os.path.isabs(env_config):
             # Absolute path - use directly
-            if env_path.exists():
-                return env_path
-        else:
-            # Relative path - only allow simple filenames (no path separators)
-            if env_path == Path(env_path.name):
-                # Check in user config directory first, then system config
-                user_config_dir = Path.home() / '.config' / 'datasette-mcp'
-                user_path = user_config_dir / env_path
-                if user_path.exists():
-                    return user_path
-                    
-                system_path = Path('/etc/datasette-mcp') / env_path
-                if system_path.exists():
-                    return system_path
-    
-    # 2. User config directory - check both formats
-    user_config_dir = Path.home() / '.config' / 'datasette-mcp'
-    for filename in ['config.yaml', 'config.yml', 'config.json']:
-        user_config = user_config_dir / filename
-        if user_config.exists():
-            return user_config
-    
-    # 3. System config directory - check both formats
-    for filename in ['config.yaml', 'config.yml', 'config.json']:
-        system_config = Path(f'/etc/datasette-mcp/{filename}')
-        if system_config.exists():
-            return system_config
-    
+            if os.path.isfile(env_config):
+                return Path(env_config)
+        elif not (os.sep in env_config or (os.altsep and os.altsep in env_config)):
+            # Relative path - only allow simple filenames (no path separators);
+            # check in user config directory first, then system config
+            for dirpath in _CONFIG_DIRS:
+                candidate = os.path.join(dirpath, env_config)
+                if os.path.isfile(candidate):
+                    return Path(candidate)
+
+    # 2. Standard directories, all formats, in priority order
+    for dirpath in _CONFIG_DIRS:
+        found = _first_existing(dirpath, _CONFIG_FILENAMES)
+        if found is not None:
+            return found
+
     return None
 
 
@@ -68,49 +181,72 @@ def load_config(config_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with open(config_path, 'r') as f:
-            if config_path.suffix.lower() == '.json':
-                loaded_config = json.load(f)
-            else:
-                # Default to YAML for .yaml, .yml, or unknown extensions
-                loaded_config = yaml.safe_load(f)
-        
+        # Serve unchanged files from the in-memory cache to skip re-parsing
+        st = config_path.stat()
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            logger.debug(f"Using cached config for {config_path}")
+            return copy.deepcopy(cached[2])
+
+        # One whole-file read; both parsers accept bytes directly, skipping
+        # the text-mode decoder and buffered file-object indirection
+        data = config_path.read_bytes()
+        if config_path.suffix.lower() == '.json':
+            loaded_config = _json_loads(data)
+        else:
+            # Default to YAML for .yaml, .yml, or unknown extensions
+            yaml_mod, yaml_loader = _get_yaml()
+            try:
+                loaded_config = yaml_mod.load(data, Loader=yaml_loader)
+            except yaml_mod.YAMLError as e:
+                logger.error(f"Invalid YAML in config file {config_path}: {e}")
+                return None
+
+        _config_cache[config_path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(loaded_config))
+
         logger.info(f"Loaded config from {config_path}")
-        logger.debug(f"Config content: {loaded_config}")
+        # Guarded so the (potentially huge) stringified config is only
+        # built when debug logging is actually on, and never leaks tokens
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Config content: %s", _redacted_view(loaded_config))
         return loaded_config
-        
+
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in config file {config_path}: {e}")
         return None
-    except yaml.YAMLError as e:
-        logger.error(f"Invalid YAML in config file {config_path}: {e}")
-        return None
     except Exception as e:
         logger.error(f"Error reading config file {config_path}: {e}")
         return None
 
 
+async def load_config_async(config_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Load configuration without blocking the event loop.
+
+    The file read and YAML/JSON parse run in a worker thread, so a config
+    reload from inside an async tool call can't stall pending requests.
+    CLI startup should keep using the synchronous load_config.
+    """
+    return await asyncio.to_thread(load_config, config_path)
+
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """Validate configuration and return True if valid."""
     if not config:
         logger.error("Configuration is empty or None")
         return False
-    
-    # Check for datasette_instances section
-    if not config.get('datasette_instances'):
+
+    # Check for a non-empty datasette_instances section in one lookup
+    instances = config.get('datasette_instances')
+    if not instances:
         logger.error("No 'datasette_instances' section in config")
         return False
-    
-    instances = config['datasette_instances']
+
     if not isinstance(instances, dict):
         logger.error("'datasette_instances' must be a dictionary")
         return False
-    
-    if len(instances) == 0:
-        logger.error("No instances configured in 'datasette_instances'")
-        return False
-    
-    # Validate each instance
+
+    # Validate each instance, building its precomputed record as we go
+    _instances.clear()
     for name, instance in instances.items():
         if not isinstance(instance, dict):
             logger.error(f"Instance '{name}' configuration must be a dictionary")
@@ -126,8 +262,9 @@ def validate_config(config: Dict[str, Any]) -> bool:
             logger.error(f"Instance '{name}' has invalid 'url' field: must be a non-empty string")
             return False
         
-        # Basic URL format validation
-        if not (url.startswith('http://') or url.startswith('https://')):
+        # Full URL validation in a single parse: scheme and a host are required
+        parsed = urlparse(url)
+        if parsed.scheme not in _ALLOWED_SCHEMES or not parsed.netloc:
             logger.error(f"Instance '{name}' URL must start with 'http://' or 'https://': {url}")
             return False
         
@@ -140,12 +277,55 @@ def validate_config(config: Dict[str, Any]) -> bool:
             logger.error(f"Instance '{name}' 'description' must be a string")
             return False
         
-        # Warn about unknown fields
-        known_fields = {'url', 'auth_token', 'description'}
-        unknown_fields = set(instance.keys()) - known_fields
-        if unknown_fields:
-            logger.warning(f"Instance '{name}' has unknown fields: {', '.join(unknown_fields)}")
-    
+        # Warn about unknown fields (skip the set arithmetic unless it would be logged)
+        if logger.isEnabledFor(logging.WARNING):
+            unknown_fields = set(instance.keys()) - _KNOWN_FIELDS
+            if unknown_fields:
+                logger.warning(f"Instance '{name}' has unknown fields: {', '.join(unknown_fields)}")
+
+        # Precompute the immutable record used on the request hot path.
+        # Interned names make the per-request dict lookups hit CPython's
+        # pointer-equality fast path, since tool callers pass the same
+        # name strings over and over.
+        name = sys.intern(name)
+        if 'auth_token' in instance:
+            headers = MappingProxyType({'Authorization': f"Bearer {instance['auth_token']}"})
+        else:
+            headers = _EMPTY_HEADERS
+        # URL is stored without a trailing slash; safe_url_join relies on this
+        _instances[name] = InstanceInfo(
+            url=url.rstrip('/'),
+            headers=headers,
+            description=instance.get('description', ''),
+            name=name
+        )
+
+    # Validate concurrency limits if present
+    for limit_field in ('max_concurrent_per_instance', 'max_concurrent_requests'):
+        if limit_field in config:
+            max_concurrent = config[limit_field]
+            if not isinstance(max_concurrent, int) or isinstance(max_concurrent, bool):
+                logger.error(f"'{limit_field}' must be an integer")
+                return False
+            if max_concurrent < 1:
+                logger.error(f"'{limit_field}' must be at least 1")
+                return False
+
+    # Validate courtesy_burst if present
+    if 'courtesy_burst' in config:
+        courtesy_burst = config['courtesy_burst']
+        if not isinstance(courtesy_burst, int) or isinstance(courtesy_burst, bool):
+            logger.error("'courtesy_burst' must be an integer")
+            return False
+        if courtesy_burst < 1:
+            logger.error("'courtesy_burst' must be at least 1")
+            return False
+
+    # Validate http2 if present
+    if 'http2' in config and not isinstance(config['http2'], bool):
+        logger.error("'http2' must be a boolean")
+        return False
+
     # Validate courtesy_delay_seconds if present
     if 'courtesy_delay_seconds' in config:
         courtesy_delay = config['courtesy_delay_seconds']
@@ -156,28 +336,21 @@ def validate_config(config: Dict[str, Any]) -> bool:
             logger.error("'courtesy_delay_seconds' must be non-negative")
             return False
     
-    logger.info(f"Configuration validated successfully: {len(instances)} instance(s) configured")
+    # One summary line instead of separate instance-count and delay messages
     courtesy_delay = config.get('courtesy_delay_seconds', 0.5)
-    if courtesy_delay > 0:
-        logger.info(f"Courtesy delay enabled: {courtesy_delay}s between requests per instance")
-    else:
-        logger.info("Courtesy delay disabled")
+    delay_summary = (
+        f"courtesy delay {courtesy_delay}s between requests per instance"
+        if courtesy_delay > 0 else "courtesy delay disabled"
+    )
+    logger.info(f"Configuration validated successfully: {len(instances)} instance(s) configured, {delay_summary}")
     return True
 
 
 def derive_id_from_url(url: str) -> str:
     """Derive instance ID from URL by escaping special characters and prefixing with _"""
-    import re
-    
-    # Replace all non-alphanumeric characters with underscores
-    escaped = re.sub(r'[^a-zA-Z0-9]', '_', url)
-    
-    # Remove multiple consecutive underscores
-    escaped = re.sub(r'_+', '_', escaped)
-    
-    # Remove leading/trailing underscores, then add single leading underscore
-    escaped = escaped.strip('_')
-    
+    # Collapse each run of non-alphanumeric characters to one underscore,
+    # then strip the edges and add the single leading underscore
+    escaped = _NON_ALNUM_RUN_RE.sub('_', url).strip('_')
     return f"_{escaped}"
 
 
@@ -207,41 +380,24 @@ def build_config_from_cli(args) -> Dict[str, Any]:
     return config
 
 
-def get_instance_config(config: Dict[str, Any], instance: str) -> Dict[str, Any]:
-    """Get complete instance configuration including URL and auth headers.
-    
+def get_instance_config(config: Dict[str, Any], instance: str) -> InstanceInfo:
+    """Get the precomputed instance record with URL and auth headers.
+
     Auto-resolves to the single instance if there's exactly one configured.
-    Assumes config has already been validated at startup.
+    Assumes config has already been validated at startup, which builds the
+    per-instance records.
     """
-    available = list(config['datasette_instances'].keys())
-    
-    if instance not in config['datasette_instances']:
+    try:
+        return _instances[instance]
+    except KeyError:
         # If there's exactly one instance, auto-select it
-        if len(available) == 1:
-            instance = available[0]
-        else:
-            raise ValueError(f"Unknown instance '{instance}'. Available: {available}")
-    
-    instance_config = config['datasette_instances'][instance]
-    
-    # Build complete instance info
-    headers = {}
-    if 'auth_token' in instance_config:
-        headers['Authorization'] = f"Bearer {instance_config['auth_token']}"
-    
-    return {
-        'url': instance_config['url'],
-        'headers': headers,
-        'description': instance_config.get('description', ''),
-        'name': instance
-    }
+        if len(_instances) == 1:
+            return next(iter(_instances.values()))
+        raise ValueError(f"Unknown instance '{instance}'. Available: {sorted(_instances)}") from None
 
 
-def build_instructions(config: Dict[str, Any]) -> str:
-    """Build enhanced instructions with dataset description."""
-    
-    # Base instructions
-    base_instructions = """
+# Base instructions, stripped once at import instead of per build
+_BASE_INSTRUCTIONS = """
     This server provides read-only access to Datasette instances.
     
     EXPLORATION WORKFLOW:
@@ -278,16 +434,38 @@ def build_instructions(config: Dict[str, Any]) -> str:
     • Search specific columns: search_table(..., search_column="title")
     • Limit columns to reduce tokens: search_table(..., columns=["title", "id", "date"])
     • Paginate large search results: search_table(..., size=20) then use next_token
+    """.strip()
+
+
+# Memoized instructions: (fingerprint of the description inputs, result)
+_instructions_cache: Optional[Tuple[tuple, str]] = None
+
+
+def build_instructions(config: Dict[str, Any]) -> str:
+    """Build enhanced instructions with dataset description.
+
+    The output is deterministic in the descriptions, so it's memoized on a
+    cheap fingerprint and rebuilt only when those change (e.g. on reload).
     """
-    
-    # Build dataset description section
-    dataset_section = ""
-    
+    global _instructions_cache
+
+    fingerprint = (
+        config.get('description'),
+        tuple(
+            (name, instance.get('description', '') if isinstance(instance, dict) else None)
+            for name, instance in (config.get('datasette_instances') or {}).items()
+        ),
+    )
+    if _instructions_cache is not None and _instructions_cache[0] == fingerprint:
+        return _instructions_cache[1]
+
+    parts = []
+
     # Check for global description
     global_description = config.get('description')
     if global_description:
-        dataset_section = f"DATASET DESCRIPTION:\n{global_description}\n\n"
-    
+        parts.append(f"DATASET DESCRIPTION:\n{global_description}\n\n")
+
     # If no global description, check for instance descriptions
     elif config.get('datasette_instances'):
         instance_descriptions = []
@@ -295,8 +473,11 @@ def build_instructions(config: Dict[str, Any]) -> str:
             description = instance_config.get('description', '')
             if description:
                 instance_descriptions.append(f"- {name}: {description}")
-        
+
         if instance_descriptions:
-            dataset_section = "DATASET DESCRIPTION:\nAvailable instances:\n" + "\n".join(instance_descriptions) + "\n\n"
-    
-    return dataset_section + base_instructions.strip()
\ No newline at end of file
+            parts.append("DATASET DESCRIPTION:\nAvailable instances:\n" + "\n".join(instance_descriptions) + "\n\n")
+
+    parts.append(_BASE_INSTRUCTIONS)
+    result = ''.join(parts)
+    _instructions_cache = (fingerprint, result)
+    return result
\ No newline at end of file
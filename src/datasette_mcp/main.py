@@ -16,18 +16,37 @@ __version__ = "0.8.1"
 # ///
 
 import asyncio
+import functools
 import os
 import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from urllib.parse import urlencode, quote, urljoin
+from urllib.parse import urlencode, quote, quote_plus
 import argparse
 import logging
 
 import httpx
 from fastmcp import FastMCP, Context
 
+try:
+    # HTTP/2 needs the optional h2 package; multiplexing concurrent tool
+    # calls over one TLS connection beats per-request HTTP/1.1 streams
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    # orjson's C parser decodes large result sets several times faster
+    # than stdlib json; fall back silently when it isn't installed
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 from .config import (
     build_config_from_cli, 
     build_instructions, 
@@ -44,81 +63,271 @@ logger = logging.getLogger(__name__)
 # Global configuration
 Config: Dict[str, Any] = {}
 
+# Per-instance HTTP clients (created lazily, reused across requests for keep-alive)
+_clients: Dict[str, httpx.AsyncClient] = {}
+
 # Request throttling state
-_last_request_time: Dict[str, float] = {}  # Track last request time per instance
+_gates: Dict[str, asyncio.Semaphore] = {}  # Per-instance concurrency gates
+_buckets: Dict[str, "TokenBucket"] = {}  # Per-instance rate limiters
+_global_gate: Optional[asyncio.Semaphore] = None  # Process-wide in-flight request cap
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for requests to one instance.
+
+    Tokens refill at one per courtesy delay up to a burst capacity, so an
+    instance that has been idle can absorb a short burst of requests while
+    the sustained rate still honors the courtesy delay. The bucket starts
+    full, so the first requests never wait.
+    """
+
+    __slots__ = ('capacity', 'refill_rate', 'tokens', 'last_refill', 'lock')
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self.last_refill = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.last_refill:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self) -> None:
+        """Reserve one token, then sleep out any deficit.
+
+        The token is taken while holding the lock, letting the balance go
+        negative; the sleep happens after release. N concurrent callers
+        therefore reserve consecutive slots (0, d, 2d, ...) and wait in
+        parallel instead of queueing on the lock one delay at a time.
+        """
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            self._refill(loop.time())
+            self.tokens -= 1.0
+            sleep_time = -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+        if sleep_time > 0:
+            logger.debug(f"Courtesy delay: waiting {sleep_time:.2f}s for a token")
+            await asyncio.sleep(sleep_time)
+
+# Short-lived cache for metadata responses (schemas change rarely, but
+# exploration loops re-request them constantly)
+_META_CACHE_TTL = 60.0  # seconds
+_META_CACHE_MAX = 512
+_meta_cache: Dict[str, tuple] = {}  # url -> (expiry time, result)
+
+
+def meta_cache_get(url: str) -> Optional[Dict[str, Any]]:
+    """Return a cached metadata response for this URL, or None if missing/expired."""
+    entry = _meta_cache.get(url)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _meta_cache[url]
+        return None
+    return entry[1]
+
+
+def meta_cache_put(url: str, result: Dict[str, Any]) -> None:
+    """Cache a metadata response, evicting the entry closest to expiry when full."""
+    if len(_meta_cache) >= _META_CACHE_MAX:
+        oldest = min(_meta_cache, key=lambda k: _meta_cache[k][0])
+        del _meta_cache[oldest]
+    _meta_cache[url] = (time.monotonic() + _META_CACHE_TTL, result)
+
+
+async def fanout(names: List[str], coro_factory) -> List[Any]:
+    """Run one coroutine per name concurrently, keeping results in order.
+
+    Failures come back as exception objects rather than cancelling the
+    rest; per-request throttling still applies inside each coroutine, and
+    the global gate bounds total concurrency.
+    """
+    return await asyncio.gather(*(coro_factory(name) for name in names), return_exceptions=True)
+
+
+async def fetch_metadata(url: str, operation: str, instance_name: str) -> Dict[str, Any]:
+    """Fetch a metadata URL through the TTL cache.
+
+    The cache is consulted before any throttling, so a hit returns
+    immediately and the courtesy delay is only paid by requests that
+    actually reach the backend.
+    """
+    result = meta_cache_get(url)
+    if result is None:
+        result = await make_datasette_request(url, operation, instance_name)
+        meta_cache_put(url, result)
+    return result
+
+
+async def get_client(instance_name: str) -> httpx.AsyncClient:
+    """Get the HTTP client for an instance, creating it on first use.
+
+    Each instance gets its own client with the auth headers baked in, so
+    per-call header construction is skipped and every instance keeps its
+    own pool of keep-alive connections, avoiding a fresh TCP+TLS
+    handshake on every Datasette call.
+    """
+    # Fast path: repeat callers resolve with one dict lookup
+    client = _clients.get(instance_name)
+    if client is not None:
+        return client
+
+    instance_config = get_instance_config(Config, instance_name)
+    # Key by the resolved name so single-instance auto-selection shares one client
+    resolved_name = instance_config.name
+    client = _clients.get(resolved_name)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=instance_config.url,
+            headers=instance_config.headers,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60,
+            ),
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE and Config.get('http2', True),
+        )
+        _clients[resolved_name] = client
+    if instance_name != resolved_name:
+        # Alias the auto-selected name so its next lookup takes the fast path
+        _clients[instance_name] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close any HTTP clients that were created."""
+    # Aliased names can map to the same client; close each once
+    for client in set(_clients.values()):
+        await client.aclose()
+    _clients.clear()
+
+
+def get_global_gate() -> asyncio.Semaphore:
+    """Get the process-wide request gate, creating it on first use.
+
+    Caps total in-flight requests across all instances so fan-out can't
+    blow past the httpx pool ceiling or the process FD limit. Created
+    lazily so the semaphore binds to the running event loop.
+    """
+    global _global_gate
+    if _global_gate is None:
+        _global_gate = asyncio.Semaphore(Config.get('max_concurrent_requests', 50))
+    return _global_gate
+
+
+def get_gate(instance_name: str) -> asyncio.Semaphore:
+    """Get the concurrency gate for an instance, creating it on first use."""
+    gate = _gates.get(instance_name)
+    if gate is None:
+        gate = asyncio.Semaphore(Config.get('max_concurrent_per_instance', 1))
+        _gates[instance_name] = gate
+    return gate
+
+
+# Courtesy delay resolved once at startup so the hot path skips the
+# Config.get lookup; refreshed by resolve_throttle_settings on (re)load
+_courtesy_delay: float = 0.5
+
+
+def resolve_throttle_settings() -> None:
+    """Snapshot throttle settings from the validated config.
+
+    Called after validate_config so per-request code reads a module
+    variable instead of hitting the config dict. Clears cached buckets
+    so a reload picks up new settings.
+    """
+    global _courtesy_delay
+    _courtesy_delay = Config.get('courtesy_delay_seconds', 0.5)
+    _buckets.clear()
+
+
+def get_bucket(instance_name: str) -> TokenBucket:
+    """Get the rate limiter for an instance, creating it on first use."""
+    bucket = _buckets.get(instance_name)
+    if bucket is None:
+        burst = Config.get('courtesy_burst', 1)
+        bucket = TokenBucket(capacity=float(burst), refill_rate=1.0 / _courtesy_delay)
+        _buckets[instance_name] = bucket
+    return bucket
 
 
 async def apply_courtesy_delay(instance_name: str) -> None:
-    """Apply courtesy delay between requests to the same instance."""
-    global _last_request_time
-    
-    # Get courtesy delay setting (default 0.5 seconds)
-    courtesy_delay = Config.get('courtesy_delay_seconds', 0.5)
-    
+    """Apply courtesy delay between requests to the same instance.
+
+    Requests draw tokens from a per-instance bucket that refills at one
+    token per courtesy delay; the bucket's lock makes the bookkeeping safe
+    under concurrency, and the monotonic event-loop clock keeps wall-clock
+    jumps (NTP corrections) from skipping or doubling delays.
+    """
     # Skip if disabled (set to 0 or negative)
-    if courtesy_delay <= 0:
+    if _courtesy_delay <= 0:
         return
-    
-    current_time = time.time()
-    last_time = _last_request_time.get(instance_name, 0)
-    
-    # Calculate how long to wait
-    time_since_last = current_time - last_time
-    if time_since_last < courtesy_delay:
-        sleep_time = courtesy_delay - time_since_last
-        logger.debug(f"Applying courtesy delay of {sleep_time:.2f}s for instance '{instance_name}'")
-        await asyncio.sleep(sleep_time)
-    
-    # Update last request time
-    _last_request_time[instance_name] = time.time()
+
+    await get_bucket(instance_name).acquire()
+
+def _format_400(response: httpx.Response) -> str:
+    """Extract the detailed error message from a Datasette 400 response."""
+    try:
+        error_data = _json_loads(response.content)
+    except ValueError:
+        return str(response.text)
+
+    if not isinstance(error_data, dict):
+        return str(response.text)
+
+    error_message = str(error_data.get("error", response.text))
+    # Include additional error context if available
+    if len(error_data) > 1:
+        error_details = {k: v for k, v in error_data.items() if k != "error"}
+        if error_details:
+            error_message += f" Details: {error_details}"
+    return error_message
+
 
 async def make_datasette_request(url: str, operation: str, instance_name: str) -> Dict[str, Any]:
     """Make HTTP request to Datasette API with consistent error handling."""
     # Apply courtesy delay before making request
     await apply_courtesy_delay(instance_name)
-    
-    # Get instance configuration for headers
-    instance_config = get_instance_config(Config, instance_name)
-    headers = instance_config['headers']
-    
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            
-            # Handle 400 errors (bad requests) by raising exception with detailed error
-            if response.status_code == 400:
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get("error", str(response.text))
-                    # Include additional error context if available
-                    if isinstance(error_data, dict) and len(error_data) > 1:
-                        error_details = {k: v for k, v in error_data.items() if k != "error"}
-                        if error_details:
-                            error_message += f" Details: {error_details}"
-                except:
-                    error_message = str(response.text)
-                
-                raise ValueError(f"Datasette API error (400): {error_message}")
-            
-            response.raise_for_status()
-            return response.json()
-            
+        client = await get_client(instance_name)
+        # Per-instance gate bounds in-flight requests to each upstream so one
+        # slow Datasette can't starve the others; the global gate caps totals
+        async with get_gate(instance_name), get_global_gate():
+            response = await client.get(url)
+        logger.debug(f"{operation}: {response.http_version} {response.status_code} {url}")
+    except Exception as e:
+        logger.error(f"Error in {operation}: {e}")
+        raise RuntimeError(f"Error in {operation}: {str(e)}")
+
+    # Handle 400 errors (bad requests) outside the try blocks so the
+    # ValueError doesn't bounce through exception matching on its way out
+    if response.status_code == 400:
+        raise ValueError(f"Datasette API error (400): {_format_400(response)}")
+
+    try:
+        response.raise_for_status()
+        return _json_loads(response.content)
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error in {operation}: {e}")
         raise RuntimeError(f"HTTP {e.response.status_code} error in {operation}: {e.response.text}")
-    except ValueError:
-        # Re-raise ValueError (from 400 handling above)
-        raise
     except Exception as e:
         logger.error(f"Error in {operation}: {e}")
         raise RuntimeError(f"Error in {operation}: {str(e)}")
 
-    
 
 
 
 # URL Builder Functions
 
+# Database and table names repeat constantly within a session; cache their
+# percent-encoded forms instead of re-scanning the string every request.
+_quote = functools.lru_cache(maxsize=4096)(quote)
+
 def build_url_with_params(base_url: str, params: List[tuple]) -> str:
     """Build URL with query parameters."""
     if not params:
@@ -126,22 +335,14 @@ def build_url_with_params(base_url: str, params: List[tuple]) -> str:
     return f"{base_url}?{urlencode(params)}"
 
 def safe_url_join(base_url: str, *paths: str) -> str:
-    """Safely join base URL with path components, handling trailing slashes properly."""
-    # Ensure base_url ends with exactly one slash for urljoin to work correctly
-    if not base_url.endswith('/'):
-        base_url += '/'
-    
-    # Join all path components
-    url = base_url
-    for path in paths:
-        # Remove leading slash from path to avoid urljoin treating it as absolute
-        path = path.lstrip('/')
-        url = urljoin(url, path)
-        # Ensure intermediate URLs end with slash for proper joining
-        if not url.endswith('/') and paths.index(path) < len(paths) - 1:
-            url += '/'
-    
-    return url
+    """Join a normalized base URL with path components.
+
+    Every caller passes pre-quoted segments and an instance URL that
+    validate_config already stripped of trailing slashes, so a plain
+    string join does the job without urljoin's full RFC 3986 parse per
+    component or a per-call rstrip of the base.
+    """
+    return base_url + '/' + '/'.join(p.strip('/') for p in paths if p)
 
 def build_sql_query_url(
     base_url: str,
@@ -155,22 +356,18 @@ def build_sql_query_url(
     next_token: Optional[str] = None
 ) -> str:
     """Build URL for executing custom SQL query."""
-    url = safe_url_join(base_url, f"{quote(database)}.json")
+    url = safe_url_join(base_url, f"{_quote(database)}.json")
+    # Build all optionals in one pass; None values mark unset parameters
+    opt = {
+        "_shape": shape,
+        "_json": ",".join(json_columns) if json_columns else None,
+        "_trace": "on" if trace else None,
+        "_timelimit": str(timelimit) if timelimit is not None else None,
+        "_size": str(size) if size is not None else None,
+        "_next": next_token,
+    }
     params = [("sql", sql)]
-    
-    if shape is not None:
-        params.append(("_shape", shape))
-    if json_columns:
-        params.append(("_json", ",".join(json_columns)))
-    if trace:
-        params.append(("_trace", "on"))
-    if timelimit is not None:
-        params.append(("_timelimit", str(timelimit)))
-    if size is not None:
-        params.append(("_size", str(size)))
-    if next_token is not None:
-        params.append(("_next", next_token))
-    
+    params += ((k, v) for k, v in opt.items() if v is not None)
     return build_url_with_params(url, params)
 
 def build_search_table_url(
@@ -187,30 +384,21 @@ def build_search_table_url(
     next_token: Optional[str] = None
 ) -> str:
     """Build URL for full-text search within a table."""
-    url = safe_url_join(base_url, quote(database), f"{quote(table)}.json")
-    params = []
-    
-    if search_column:
-        params.append((f"_search_{search_column}", search_term))
-    else:
-        params.append(("_search", search_term))
-    
+    url = safe_url_join(base_url, _quote(database), f"{_quote(table)}.json")
+    params = [(f"_search_{search_column}" if search_column else "_search", search_term)]
+
     if columns:
-        # Add column selection parameters
-        for col in columns:
-            params.append(("_col", col))
-    
-    if raw_mode:
-        params.append(("_searchmode", "raw"))
-    if shape is not None:
-        params.append(("_shape", shape))
-    if size is not None:
-        params.append(("_size", str(size)))
-    if json_columns:
-        params.append(("_json", ",".join(json_columns)))
-    if next_token is not None:
-        params.append(("_next", next_token))
-    
+        # Column selection repeats the _col key, so it can't live in the dict
+        params += (("_col", col) for col in columns)
+
+    opt = {
+        "_searchmode": "raw" if raw_mode else None,
+        "_shape": shape,
+        "_size": str(size) if size is not None else None,
+        "_json": ",".join(json_columns) if json_columns else None,
+        "_next": next_token,
+    }
+    params += ((k, v) for k, v in opt.items() if v is not None)
     return build_url_with_params(url, params)
 
 def build_list_databases_url(base_url: str) -> str:
@@ -219,15 +407,19 @@ def build_list_databases_url(base_url: str) -> str:
 
 def build_database_url(base_url: str, database: str, shape: Optional[str] = None, size: Optional[int] = None, next_token: Optional[str] = None) -> str:
     """Build URL for getting database metadata (including tables)."""
-    url = safe_url_join(base_url, f"{quote(database)}.json")
-    params = []
-    if shape is not None:
-        params.append(("_shape", shape))
-    if size is not None:
-        params.append(("_size", str(size)))
-    if next_token is not None:
-        params.append(("_next", next_token))
-    return build_url_with_params(url, params)
+    url = safe_url_join(base_url, f"{_quote(database)}.json")
+    # Metadata calls almost never pass options; skip the params machinery entirely
+    if shape is None and size is None:
+        if next_token is None:
+            return url
+        # Pagination passes only the token; format it without the urlencode loop
+        return f"{url}?_next={quote_plus(next_token)}"
+    opt = {
+        "_shape": shape,
+        "_size": str(size) if size is not None else None,
+        "_next": next_token,
+    }
+    return build_url_with_params(url, [(k, v) for k, v in opt.items() if v is not None])
 
 
 # FastMCP Server Setup
@@ -237,7 +429,33 @@ mcp = FastMCP(
     instructions=""  # Will be set dynamically after config is loaded
 )
 
+
+def datasette_tool(operation: str):
+    """Wrap a tool body with the shared error-reporting boilerplate.
+
+    Every tool reports ValueError (configuration or Datasette API errors)
+    and unexpected exceptions to the MCP context the same way; doing it
+    here keeps the tool bodies down to the URL build and request.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, ctx: Context = None, **kwargs):
+            try:
+                return await fn(*args, ctx=ctx, **kwargs)
+            except ValueError as e:
+                if ctx:
+                    await ctx.error(f"Error in {operation}: {e}")
+                raise
+            except Exception as e:
+                if ctx:
+                    await ctx.error(f"Unexpected error in {operation}: {e}")
+                raise
+        return wrapper
+    return decorator
+
+
 @mcp.tool()
+@datasette_tool("execute_sql")
 async def execute_sql(
     instance: str, 
     database: str, 
@@ -266,29 +484,71 @@ async def execute_sql(
     Returns:
         Query results and metadata (includes 'next_url' for pagination if more results available)
     """
-    try:
-        instance_config = get_instance_config(Config, instance)
-        
+    instance_config = get_instance_config(Config, instance)
+
+    url = build_sql_query_url(
+        instance_config.url, database, sql, shape, json_columns, trace, timelimit, size, next_token
+    )
+
+    if ctx:
+        await ctx.info(f"Executing SQL on {instance}/{database}: {sql[:100]}...")
+
+    return await make_datasette_request(url, "execute_sql", instance)
+
+@mcp.tool()
+@datasette_tool("execute_sql_batch")
+async def execute_sql_batch(
+    instance: str,
+    database: str,
+    queries: List[str],
+    shape: Optional[str] = None,
+    json_columns: Optional[List[str]] = None,
+    timelimit: Optional[int] = None,
+    size: Optional[int] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Execute multiple SQL queries against one database concurrently.
+
+    The queries fan out in parallel while sharing the instance's courtesy
+    delay schedule, so N queries are paced by one rate limiter instead of
+    each paying the full delay serially.
+
+    Args:
+        instance: Name of the Datasette instance (from config)
+        database: Database name
+        queries: List of SQL queries to execute
+        shape: JSON shape applied to every query (uses Datasette default if not specified)
+        json_columns: List of columns to parse as JSON
+        timelimit: Query timeout in milliseconds
+        size: Maximum number of results per query (uses Datasette default if not specified)
+
+    Returns:
+        Per-query results in input order; a failed query yields an 'error'
+        entry instead of cancelling the rest of the batch
+    """
+    instance_config = get_instance_config(Config, instance)
+
+    if ctx:
+        await ctx.info(f"Executing {len(queries)} SQL queries on {instance}/{database}")
+
+    async def run_one(sql: str) -> Dict[str, Any]:
         url = build_sql_query_url(
-            instance_config['url'], database, sql, shape, json_columns, trace, timelimit, size, next_token
+            instance_config.url, database, sql, shape, json_columns, False, timelimit, size, None
         )
-        
-        if ctx:
-            await ctx.info(f"Executing SQL on {instance}/{database}: {sql[:100]}...")
-        
-        return await make_datasette_request(url, "execute_sql", instance)
-        
-    except ValueError as e:
-        # Configuration errors (instance not found, missing URL, etc.) or Datasette API errors
-        if ctx:
-            await ctx.error(f"Error in execute_sql: {e}")
-        raise
-    except Exception as e:
-        if ctx:
-            await ctx.error(f"Unexpected error in execute_sql: {e}")
-        raise
+        return await make_datasette_request(url, "execute_sql_batch", instance)
+
+    results = await asyncio.gather(*(run_one(sql) for sql in queries), return_exceptions=True)
+
+    return {
+        "results": [
+            {"error": str(result)} if isinstance(result, BaseException) else result
+            for result in results
+        ],
+        "count": len(queries)
+    }
 
 @mcp.tool()
+@datasette_tool("search_table")
 async def search_table(
     instance: str,
     database: str, 
@@ -321,57 +581,42 @@ async def search_table(
     Returns:
         Search results and metadata (includes 'next_url' for pagination if more results available)
     """
-    try:
-        instance_config = get_instance_config(Config, instance)
-        
-        url = build_search_table_url(
-            instance_config['url'], database, table, search_term, search_column, 
-            columns, raw_mode, shape, size, json_columns, next_token
-        )
-        
-        if ctx:
-            await ctx.info(f"Searching {instance}/{database}/{table} for: {search_term}")
-        
-        return await make_datasette_request(url, "search_table", instance)
-        
-    except ValueError as e:
-        # Configuration errors (instance not found, missing URL, etc.) or Datasette API errors
-        if ctx:
-            await ctx.error(f"Error in search_table: {e}")
-        raise
-    except Exception as e:
-        if ctx:
-            await ctx.error(f"Unexpected error in search_table: {e}")
-        raise
+    instance_config = get_instance_config(Config, instance)
+
+    url = build_search_table_url(
+        instance_config.url, database, table, search_term, search_column,
+        columns, raw_mode, shape, size, json_columns, next_token
+    )
+
+    if ctx:
+        await ctx.info(f"Searching {instance}/{database}/{table} for: {search_term}")
+
+    return await make_datasette_request(url, "search_table", instance)
 
 @mcp.tool()
+@datasette_tool("list_instances")
 async def list_instances(ctx: Context = None) -> Dict[str, Any]:
     """List all configured Datasette instances.
     
     Returns:
         List of instances with their configuration details
     """
-    try:
-        instances = []
-        for name, instance_config in Config['datasette_instances'].items():
-            instances.append({
-                "name": name,
-                "url": instance_config['url'],
-                "description": instance_config.get('description', ''),
-                "has_auth": bool(instance_config.get('auth_token'))
-            })
-        
-        return {
-            "instances": instances,
-            "count": len(instances)
-        }
-        
-    except Exception as e:
-        if ctx:
-            await ctx.error(f"Error listing instances: {e}")
-        raise
+    instances = []
+    for name, instance_config in Config['datasette_instances'].items():
+        instances.append({
+            "name": name,
+            "url": instance_config['url'],
+            "description": instance_config.get('description', ''),
+            "has_auth": bool(instance_config.get('auth_token'))
+        })
+
+    return {
+        "instances": instances,
+        "count": len(instances)
+    }
 
 @mcp.tool()
+@datasette_tool("list_databases")
 async def list_databases(instance: str, ctx: Context = None) -> Dict[str, Any]:
     """List all databases in a Datasette instance.
     
@@ -381,41 +626,63 @@ async def list_databases(instance: str, ctx: Context = None) -> Dict[str, Any]:
     Returns:
         List of databases and metadata
     """
-    try:
-        instance_config = get_instance_config(Config, instance)
-        
-        url = build_list_databases_url(instance_config['url'])
-        
-        result = await make_datasette_request(url, "list_databases", instance)
-        
-        # Transform the response to match expected database list format
-        databases = []
-        for key, value in result.items():
-            if isinstance(value, dict) and 'path' in value:
-                databases.append({
-                    "name": key,
-                    "path": value.get('path', f'/{key}'),
-                    "tables_count": value.get('tables_count', 0),
-                    "hidden_tables_count": value.get('hidden_tables_count', 0)
-                })
-        
-        return {
-            "databases": databases,
-            "instance": instance
-        }
-            
-    except ValueError as e:
-        # Configuration errors (instance not found, missing URL, etc.) or Datasette API errors
-        if ctx:
-            await ctx.error(f"Error in list_databases: {e}")
-        raise
-    except Exception as e:
-        if ctx:
-            await ctx.error(f"Unexpected error in list_databases: {e}")
-        raise
+    return await _list_databases(instance)
+
+
+async def _list_databases(instance: str) -> Dict[str, Any]:
+    """Fetch and shape the database list for one instance."""
+    instance_config = get_instance_config(Config, instance)
+
+    url = build_list_databases_url(instance_config.url)
+
+    result = await fetch_metadata(url, "list_databases", instance)
+
+    # Transform the response to match expected database list format
+    databases = []
+    for key, value in result.items():
+        if isinstance(value, dict) and 'path' in value:
+            databases.append({
+                "name": key,
+                "path": value.get('path', f'/{key}'),
+                "tables_count": value.get('tables_count', 0),
+                "hidden_tables_count": value.get('hidden_tables_count', 0)
+            })
+
+    return {
+        "databases": databases,
+        "instance": instance
+    }
 
 
 @mcp.tool()
+@datasette_tool("list_all_databases")
+async def list_all_databases(ctx: Context = None) -> Dict[str, Any]:
+    """List databases across all configured instances concurrently.
+
+    Instances are queried in parallel rather than one RTT at a time;
+    a failing instance reports an error entry instead of failing the call.
+
+    Returns:
+        Mapping of instance name to its database list (or error)
+    """
+    names = list(Config['datasette_instances'].keys())
+
+    if ctx:
+        await ctx.info(f"Listing databases across {len(names)} instance(s)")
+
+    results = await fanout(names, _list_databases)
+
+    return {
+        "instances": {
+            name: {"error": str(result)} if isinstance(result, BaseException) else result
+            for name, result in zip(names, results)
+        },
+        "count": len(names)
+    }
+
+
+@mcp.tool()
+@datasette_tool("describe_database")
 async def describe_database(instance: str, database: str, ctx: Context = None) -> Dict[str, Any]:
     """Get complete database metadata including all table schemas and column information.
     
@@ -426,30 +693,32 @@ async def describe_database(instance: str, database: str, ctx: Context = None) -
     Returns:
         Complete database metadata with all tables and their schemas
     """
-    try:
-        instance_config = get_instance_config(Config, instance)
-        
-        url = build_database_url(instance_config['url'], database)
-        
-        if ctx:
-            await ctx.info(f"Describing database {instance}/{database}")
-        
-        return await make_datasette_request(url, "describe_database", instance)
-        
-    except ValueError as e:
-        # Configuration errors (instance not found, missing URL, etc.) or Datasette API errors
-        if ctx:
-            await ctx.error(f"Error in describe_database: {e}")
-        raise
-    except Exception as e:
-        if ctx:
-            await ctx.error(f"Unexpected error in describe_database: {e}")
-        raise
+    instance_config = get_instance_config(Config, instance)
+
+    url = build_database_url(instance_config.url, database)
 
+    if ctx:
+        await ctx.info(f"Describing database {instance}/{database}")
+
+    return await fetch_metadata(url, "describe_database", instance)
+
+
+
+# CLI choice sets, shared by the parser and the transport dispatch
+_TRANSPORT_CHOICES = ("stdio", "streamable-http", "sse")
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR")
 
 
 def main():
     """Main entry point for CLI."""
+    # Prefer uvloop's libuv-backed event loop when available; the server is
+    # pure async I/O so the faster loop helps under concurrent tool calls
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(description="Datasette MCP Server")
     
     # Configuration source options
@@ -482,7 +751,7 @@ def main():
     # Transport options
     parser.add_argument(
         "--transport",
-        choices=["stdio", "streamable-http", "sse"],
+        choices=_TRANSPORT_CHOICES,
         default="stdio",
         help="Transport protocol (default: stdio)"
     )
@@ -499,7 +768,7 @@ def main():
     )
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        choices=_LOG_LEVEL_CHOICES,
         default="INFO",
         help="Logging level (default: INFO)"
     )
@@ -539,25 +808,33 @@ def main():
     
     logger.info(f"Configured instances: {list(Config['datasette_instances'].keys())}")
 
+    # Resolve throttle settings once so per-request code skips the dict lookups
+    resolve_throttle_settings()
+
     # Set instructions based on configuration
     # Using internal MCP server attribute as workaround
     mcp._mcp_server.instructions = build_instructions(Config)
 
     # Run the server
-    if args.transport == "stdio":
-        mcp.run(transport="stdio")
-    elif args.transport == "streamable-http":
-        mcp.run(
-            transport="streamable-http",
-            host=args.host,
-            port=args.port
-        )
-    elif args.transport == "sse":
-        mcp.run(
-            transport="sse",
-            host=args.host,
-            port=args.port
-        )
+    try:
+        if args.transport == "stdio":
+            mcp.run(transport="stdio")
+        elif args.transport == "streamable-http":
+            mcp.run(
+                transport="streamable-http",
+                host=args.host,
+                port=args.port
+            )
+        elif args.transport == "sse":
+            mcp.run(
+                transport="sse",
+                host=args.host,
+                port=args.port
+            )
+    finally:
+        # Clean up any HTTP clients on shutdown
+        if _clients:
+            asyncio.run(close_clients())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file